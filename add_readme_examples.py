@@ -1,39 +1,36 @@
 import re
 import sys
-from io import StringIO
+from subprocess import run
+
+_OUTPUT_BLOCK_RE = re.compile(r'(```output\n.*?\n```)', re.DOTALL)
+_PYTHON_BLOCK_RE = re.compile(r'(```python\n.*?\n```)', re.DOTALL)
 
 
 def capture_python_output(py_file):
-    old_stdout = sys.stdout
-    sys.stdout = mystdout = StringIO()
+    result = run(
+        [sys.executable, py_file],
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+    )
 
-    try:
-        with open(py_file, 'r', encoding='utf-8') as f:
-            exec(f.read(), {'__name__': '__main__'})
-    except Exception as e:
-        print(f'Erro ao executar: {str(e)}')
-    finally:
-        sys.stdout = old_stdout
+    if result.returncode != 0:
+        return f'Erro ao executar: {result.stderr.strip()}'
 
-    return mystdout.getvalue()
+    return result.stdout
 
 
 def update_nth_output_block(md_file, output_text, n=1):
     with open(md_file, 'r', encoding='utf-8') as f:
         md_content = f.read()
 
-    parts = re.split(r'```output\n.*?\n```', md_content, flags=re.DOTALL)
-    output_blocks = re.findall(r'```output\n.*?\n```', md_content, re.DOTALL)
-    print(output_blocks)
-
-    output_blocks[n - 1] = f'```output\n{output_text}\n```'
-
-    updated_content = parts[0]
-    for i in range(len(output_blocks)):
-        updated_content += output_blocks[i] + parts[i + 1]
+    # The capturing group keeps the blocks in the split result, so one pass
+    # yields the surrounding text and the blocks interleaved.
+    parts = _OUTPUT_BLOCK_RE.split(md_content)
+    parts[2 * n - 1] = f'```output\n{output_text}\n```'
 
     with open(md_file, 'w', encoding='utf-8') as f:
-        f.write(updated_content)
+        f.write(''.join(parts))
 
 
 def update_nth_python_block(py_file, md_file, n=1):
@@ -43,17 +40,11 @@ def update_nth_python_block(py_file, md_file, n=1):
     with open(md_file, 'r', encoding='utf-8') as f:
         md_content = f.read()
 
-    parts = re.split(r'```python\n.*?\n```', md_content, flags=re.DOTALL)
-    py_blocks = re.findall(r'```python\n.*?\n```', md_content, re.DOTALL)
-
-    py_blocks[n - 1] = f'```python\n{py_content}\n```'
-
-    updated_content = parts[0]
-    for i in range(len(py_blocks)):
-        updated_content += py_blocks[i] + parts[i + 1]
+    parts = _PYTHON_BLOCK_RE.split(md_content)
+    parts[2 * n - 1] = f'```python\n{py_content}\n```'
 
     with open(md_file, 'w', encoding='utf-8') as f:
-        f.write(updated_content)
+        f.write(''.join(parts))
 
 
 if __name__ == "__main__":
@@ -1,14 +1,284 @@
 """Module that calculates important metrics for call center planning."""
 
 from datetime import datetime
-from math import ceil, exp, factorial
+from functools import lru_cache
+from math import ceil, exp
+from os import environ
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+    from pandas import DataFrame
+
+
+def _erlang_c_kernel(traffic_intensity: float, agents: int) -> float:
+    """Calculate the Erlang C probability for a given traffic intensity.
+
+    Uses the Erlang B recursion ``B(k) = a*B(k-1) / (k + a*B(k-1))`` and
+    derives Erlang C from the final blocking probability. Every intermediate
+    value stays in ``[0, 1]``, so the evaluation is numerically stable for
+    arbitrarily large agent counts, at O(agents) multiplications. The body
+    uses only scalar float arithmetic so Numba can compile it when available.
+
+    Parameters
+    ----------
+    traffic_intensity : float
+        The traffic intensity in Erlangs.
+    agents : int
+        The quantity of agents to answer those calls.
+
+    Returns
+    -------
+    float
+        Probability that a call will wait in queue (Erlang C).
+    """
+    _blocking: float = 1.0
+    for k in range(1, agents + 1):
+        _blocking = (
+            traffic_intensity * _blocking / (k + traffic_intensity * _blocking)
+        )
+    return (
+        agents
+        * _blocking
+        / (agents - traffic_intensity * (1 - _blocking))
+    )
+
+
+try:
+    # Numba is optional: when installed, the kernel is compiled to a tight
+    # native loop; otherwise the pure-Python version above is used as is.
+    from numba import njit
+
+    # fastmath is deliberately not enabled: it reorders the ladder's
+    # floating-point operations, making the compiled kernel diverge from the
+    # pure-Python results by one ulp and breaking the doctest gate.
+    _erlang_c_kernel = njit(cache=True)(_erlang_c_kernel)
+except ImportError:
+    pass
+
+if environ.get('ERLANG_NO_WARM') != '1':
+    # Trigger Numba's JIT compilation at import so it does not land on the
+    # first user-facing call; under pure Python this is one cheap evaluation.
+    _erlang_c_kernel(1.0, 2)
+
+
+@lru_cache(maxsize=4096)
+def _erlang_c(traffic_intensity: float, agents: int) -> float:
+    """Calculate the Erlang C probability, memoizing repeated evaluations.
+
+    The agent search evaluates the same traffic intensity at many consecutive
+    agent counts, so results of the kernel are cached per argument pair.
+
+    Parameters
+    ----------
+    traffic_intensity : float
+        The traffic intensity in Erlangs.
+    agents : int
+        The quantity of agents to answer those calls.
+
+    Returns
+    -------
+    float
+        Probability that a call will wait in queue (Erlang C).
+    """
+    return _erlang_c_kernel(traffic_intensity, agents)
+
+
+def erlang_c(traffic_intensity: float, agents: int) -> float:
+    """Calculate the probability that a call will wait in queue (Erlang C formula).
+
+    Positional fast path for callers sweeping many evaluations without
+    building a :class:`CallCenterPredictions` instance.
+
+    Parameters
+    ----------
+    traffic_intensity : float
+        The traffic intensity in Erlangs.
+    agents : int
+        The quantity of agents to answer those calls.
+
+    Returns
+    -------
+    float
+        Probability that a call will wait in queue (Erlang C).
+
+    Examples
+    --------
+    >>> erlang_c(32.5, 35)
+    0.5700850250324965
+    """
+    return _erlang_c(traffic_intensity, agents)
+
+
+def service_level(
+    traffic_intensity: float,
+    agents: int,
+    target_answer_time: int,
+    average_handling_time: int,
+) -> float:
+    """Calculate the estimated service level.
+
+    Positional fast path for callers sweeping many evaluations without
+    building a :class:`CallCenterPredictions` instance.
+
+    Parameters
+    ----------
+    traffic_intensity : float
+        The traffic intensity in Erlangs.
+    agents : int
+        The quantity of agents to answer those calls.
+    target_answer_time : int
+        The target service level time to answer a call in seconds.
+    average_handling_time : int
+        The average handling time in seconds.
+
+    Returns
+    -------
+    float
+        Estimated service level (probability that a call is answered within the target time).
+
+    Examples
+    --------
+    >>> service_level(32.5, 35, 30, 300)
+    0.5560173360874103
+    """
+    return 1 - _erlang_c(traffic_intensity, agents) * exp(
+        (traffic_intensity - agents) * (target_answer_time / average_handling_time)
+    )
+
+
+def make_planner(
+    traffic_intensity: float,
+    average_handling_time: int,
+    target_answer_time: int,
+) -> Callable[[int], float]:
+    """Build a service-level function specialized for one forecast interval.
+
+    When sweeping candidate agent counts for a fixed interval, the traffic
+    intensity and the ``target_answer_time / average_handling_time`` ratio do
+    not change. The returned function has both baked in as closure constants,
+    so each probe is a single kernel call plus one ``exp``.
+
+    Parameters
+    ----------
+    traffic_intensity : float
+        The traffic intensity in Erlangs.
+    average_handling_time : int
+        The average handling time in seconds.
+    target_answer_time : int
+        The target service level time to answer a call in seconds.
+
+    Returns
+    -------
+    Callable[[int], float]
+        A function mapping an agent count to the estimated service level.
+
+    Examples
+    --------
+    >>> plan = make_planner(32.5, 300, 30)
+    >>> plan(35)
+    0.5560173360874103
+    """
+    _decay_rate: float = target_answer_time / average_handling_time
+
+    def plan(agents: int) -> float:
+        return 1 - _erlang_c(traffic_intensity, agents) * exp(
+            (traffic_intensity - agents) * _decay_rate
+        )
 
-from pandas import DataFrame
+    return plan
+
+
+def agents_required_vec(
+    traffic_intensity: 'ndarray',
+    average_handling_time: int,
+    target_answer_time: int,
+    target_service_level: float,
+    max_agents: int,
+) -> 'ndarray':
+    # TODO Add tests
+    """Calculate the agents required for a batch of intervals at once.
+
+    Advances the Erlang B ladder one server at a time for every interval in
+    parallel, so planning a full day of intervals is one broadcast recursion
+    instead of one Python search per interval. As in the scalar kernel, every
+    blocking probability stays in ``[0, 1]``, so large traffic intensities
+    cannot overflow.
+
+    Parameters
+    ----------
+    traffic_intensity : ndarray
+        The traffic intensity of each interval, in Erlangs.
+    average_handling_time : int
+        The average handling time in seconds.
+    target_answer_time : int
+        The target service level time to answer a call in seconds.
+    target_service_level : float
+        The service level required. This should be a number between 0 and 1 (both ends included).
+    max_agents : int
+        The largest agent count considered per interval.
+
+    Returns
+    -------
+    ndarray
+        The minimum number of agents required per interval to meet the target service level.
+
+    Raises
+    ------
+    ValueError
+        If some interval cannot meet the target with ``max_agents`` agents.
+    """
+    import numpy as np
+
+    _ti = np.asarray(traffic_intensity, dtype=float)
+    _k = np.arange(1, max_agents + 1)
+
+    # _ec[:, k-1] holds Erlang C at k agents, derived from the blocking
+    # probability exactly as in the scalar kernel. Where the queue is
+    # unstable (k below the load) the denominator is not positive; those
+    # candidates are excluded below, so their entries are left at zero.
+    _blocking = np.ones_like(_ti)
+    _ec = np.empty((_ti.shape[0], max_agents))
+    for k in range(1, max_agents + 1):
+        _blocking = _ti * _blocking / (k + _ti * _blocking)
+        _den = k - _ti * (1 - _blocking)
+        _ec[:, k - 1] = k * _blocking / np.where(_den > 0, _den, np.inf)
+
+    # The exponent is non-positive wherever the queue is stable; clipping it
+    # at zero avoids spurious overflow in the excluded region.
+    _exponent = np.minimum(
+        (_ti[:, None] - _k) * (target_answer_time / average_handling_time), 0.0
+    )
+    _sl = 1 - _ec * np.exp(_exponent)
+
+    # Candidates below the traffic intensity cannot keep up with the load and
+    # make the Erlang C expression meaningless, so they are excluded.
+    _meets = (_sl >= target_service_level) & (_k >= _ti[:, None])
+    if not _meets.any(axis=1).all():
+        raise ValueError(
+            f'Some interval cannot meet the target service level with {max_agents} agents.'
+        )
+    return np.argmax(_meets, axis=1) + 1
 
 
 class CallCenterPredictions:
     """Class that contains the predictable variables of a call center in a certain period of time."""
 
+    __slots__ = (
+        'start_time',
+        'end_time',
+        'calls',
+        'aht',
+        'tsl',
+        'tat',
+        '_period_s',
+        '_tat_over_aht',
+        'erlangs',
+        'raw_agents',
+        'p_wait',
+        '_decay_tat',
+    )
+
     def __init__(
         self,
         start_time: datetime,
@@ -57,9 +327,15 @@ class CallCenterPredictions:
                 f'The target service level should be a number between 0 and 1 (both ends included). But {self.tsl} was given.'
             )
 
+        self._period_s: float = (self.end_time - self.start_time).total_seconds()
+        self._tat_over_aht: float = self.tat / self.aht
         self.erlangs: float = self.traffic_intensity()
+        # raw_agents_required also stores p_wait, the Erlang C probability it
+        # already computed for the accepted agent count.
         self.raw_agents: int = self.raw_agents_required()
-        self.p_wait: float = self.erlang_c(self.raw_agents)
+        self._decay_tat: float = exp(
+            (self.erlangs - self.raw_agents) * self._tat_over_aht
+        )
 
     def traffic_intensity(self) -> float:
         """Calculate traffic intensity (in Erlangs).
@@ -83,8 +359,7 @@ class CallCenterPredictions:
         >>> pred.traffic_intensity()
         32.5
         """
-        _period = (self.end_time - self.start_time).total_seconds()
-        return self.calls * (self.aht / _period)
+        return self.calls * (self.aht / self._period_s)
 
     def erlang_c(self, agents: int) -> float:
         # TODO Add tests
@@ -112,13 +387,42 @@ class CallCenterPredictions:
         ...     target_answer_time=30,
         ... )
         >>> pred.erlang_c(35)
-        0.5700850250324968
+        0.5700850250324965
         """
-        _num: float = self.erlangs**agents / factorial(agents)
-        _den: float = sum(self.erlangs**_ / factorial(_) for _ in range(agents)) * (
-            1 - self.erlangs / agents
-        )
-        return _num / (_den + _num)
+        return _erlang_c(self.erlangs, agents)
+
+    def erlang_c_range(self, min_agents: int, max_agents: int) -> 'ndarray':
+        # TODO Add tests
+        """Calculate Erlang C for a whole range of agent counts at once.
+
+        Advances the Erlang B ladder from one server up to ``max_agents``,
+        recording the Erlang C value at every step, so the whole range costs
+        a single O(max_agents) pass. As in the scalar kernel, every blocking
+        probability stays in ``[0, 1]``, so large traffic intensities cannot
+        overflow. Candidates below the traffic intensity, where the queue is
+        unstable, are reported as 1.0 (a call certainly waits).
+
+        Parameters
+        ----------
+        min_agents : int
+            The smallest agent count evaluated.
+        max_agents : int
+            The largest agent count evaluated.
+
+        Returns
+        -------
+        ndarray
+            The Erlang C probability for each agent count from ``min_agents`` to ``max_agents``.
+        """
+        import numpy as np
+
+        _ec = np.empty(max_agents)
+        _blocking: float = 1.0
+        for k in range(1, max_agents + 1):
+            _blocking = self.erlangs * _blocking / (k + self.erlangs * _blocking)
+            _den: float = k - self.erlangs * (1 - _blocking)
+            _ec[k - 1] = k * _blocking / _den if _den > 0 else 1.0
+        return _ec[min_agents - 1 :]
 
     def service_level(self, agents: int) -> float:
         # TODO Add tests
@@ -146,10 +450,12 @@ class CallCenterPredictions:
         ...     target_answer_time=30,
         ... )
         >>> pred.service_level(35)
-        0.5560173360874101
+        0.5560173360874103
         """
+        if agents == self.raw_agents:
+            return 1 - self.p_wait * self._decay_tat
         return 1 - (
-            self.erlang_c(agents) * exp((self.erlangs - agents) * (self.tat / self.aht))
+            self.erlang_c(agents) * exp((self.erlangs - agents) * self._tat_over_aht)
         )
 
     def raw_agents_required(self) -> int:
@@ -157,6 +463,9 @@ class CallCenterPredictions:
         # TODO Add tests
         """Calculate the quantity of agents required to achieve the target service level.
 
+        Also stores the Erlang C probability at the returned agent count in
+        ``p_wait``, since the search computes it anyway.
+
         Returns
         -------
         int
@@ -177,9 +486,26 @@ class CallCenterPredictions:
         38
         """
         agents: int = ceil(self.erlangs)  # Initial guess for agents
-        while self.service_level(agents) < self.tsl:
+
+        # Build the Erlang B ladder once for the initial guess, then advance
+        # it one server per extra agent so each candidate costs O(1) instead
+        # of a full Erlang C evaluation.
+        _blocking: float = 1.0
+        for k in range(1, agents + 1):
+            _blocking = self.erlangs * _blocking / (k + self.erlangs * _blocking)
+
+        while True:
+            _ec: float = (
+                agents * _blocking / (agents - self.erlangs * (1 - _blocking))
+            )
+            _sl: float = 1 - _ec * exp(
+                (self.erlangs - agents) * self._tat_over_aht
+            )
+            if _sl >= self.tsl:
+                self.p_wait = _ec
+                return agents
             agents += 1
-        return agents
+            _blocking = self.erlangs * _blocking / (agents + self.erlangs * _blocking)
 
     def average_speed_of_answer(self) -> float:
         # TODO Add exemples
@@ -253,7 +579,7 @@ class CallCenterPredictions:
             (self.erlangs - self.raw_agents) * (average_patience / self.aht)
         )
 
-    def to_pandas(self) -> DataFrame:
+    def to_pandas(self) -> 'DataFrame':
         # TODO Add tests
         """Return the data in a pandas.DataFrame.
 
@@ -277,16 +603,135 @@ class CallCenterPredictions:
                    start_time            end_time  calls  aht  tsl  tat  erlangs  raw_agents    p_wait
         0 2021-04-01 08:00:00 2021-04-01 09:00:00    390  300  0.8   30     32.5          38  0.261203
         """
-        return DataFrame([self.__dict__])
+        from pandas import DataFrame
+
+        return DataFrame(
+            [{k: getattr(self, k) for k in self.__slots__ if not k.startswith('_')}]
+        )
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        data: 'DataFrame',
+        calls_column: str,
+        period_column: str,
+        average_handling_time: int,
+        target_service_level: float,
+        target_answer_time: int,
+        max_agents: int = 1000,
+    ) -> 'DataFrame':
+        # TODO Add tests
+        """Plan every interval of a forecast dataframe in one vectorized pass.
+
+        Instead of building one :class:`CallCenterPredictions` per row, the
+        calls and period columns are converted to NumPy arrays and fed to
+        :func:`agents_required_vec`, so the whole forecast is planned without
+        per-row Python objects.
+
+        Parameters
+        ----------
+        data : DataFrame
+            The forecast, one interval per row.
+        calls_column : str
+            The name of the column with the number of expected calls.
+        period_column : str
+            The name of the column with the interval length in seconds.
+        average_handling_time : int
+            The average handling time in seconds.
+        target_service_level : float
+            The service level required in each interval. This should be a number between 0 and 1 (both ends included).
+        target_answer_time : int
+            The target service level time to answer a call in seconds.
+        max_agents : int, optional
+            The largest agent count considered per interval, by default 1000.
+
+        Returns
+        -------
+        DataFrame
+            One row per interval with ``erlangs``, ``raw_agents``, ``service_level`` and ``occupancy`` columns.
+
+        Raises
+        ------
+        ValueError
+            If ``target_service_level`` given is not a number between 0 and 1 (both ends included).
+        """
+        if target_service_level > 1 or target_service_level < 0:
+            raise ValueError(
+                f'The target service level should be a number between 0 and 1 (both ends included). But {target_service_level} was given.'
+            )
+
+        from pandas import DataFrame
+
+        _calls = data[calls_column].to_numpy(dtype=float)
+        _period = data[period_column].to_numpy(dtype=float)
+        _erlangs = _calls * average_handling_time / _period
+
+        _raw_agents = agents_required_vec(
+            _erlangs,
+            average_handling_time,
+            target_answer_time,
+            target_service_level,
+            max_agents,
+        )
+        _service_level = [
+            service_level(_ti, int(_k), target_answer_time, average_handling_time)
+            for _ti, _k in zip(_erlangs, _raw_agents)
+        ]
+
+        return DataFrame(
+            {
+                'erlangs': _erlangs,
+                'raw_agents': _raw_agents,
+                'service_level': _service_level,
+                'occupancy': _erlangs / _raw_agents,
+            }
+        )
+
+    @classmethod
+    def to_dataframe(
+        cls, predictions: list['CallCenterPredictions']
+    ) -> 'DataFrame':
+        # TODO Add tests
+        """Return the data of many predictions in a single pandas.DataFrame.
+
+        Aggregating with one DataFrame construction avoids paying
+        :meth:`to_pandas`'s per-call frame-building cost for every instance
+        when collecting predictions across many intervals.
+
+        Parameters
+        ----------
+        predictions : list[CallCenterPredictions]
+            The predictions to aggregate, one row each.
+
+        Returns
+        -------
+        DataFrame
+            The data, both given and calculated, of every prediction.
+        """
+        from pandas import DataFrame
+
+        return DataFrame(
+            [
+                {
+                    k: getattr(_pred, k)
+                    for k in _pred.__slots__
+                    if not k.startswith('_')
+                }
+                for _pred in predictions
+            ]
+        )
 
     def __str__(self) -> str:
         # TODO Add tests
         """Return the data in a string format.
 
+        Formats the attributes directly so printing an instance does not pay
+        for building a pandas.DataFrame.
+
         Returns
         -------
         str
-            The data in string format, similar to pandas.DataFrame style.
+            The data, both given and calculated, in string format.
 
         Examples
         --------
@@ -300,7 +745,11 @@ class CallCenterPredictions:
         ...     target_answer_time=30,
         ... )
         >>> print(pred)
-                   start_time            end_time  calls  aht  tsl  tat  erlangs  raw_agents    p_wait
-        0 2021-04-01 08:00:00 2021-04-01 09:00:00    390  300  0.8   30     32.5          38  0.261203
+        CallCenterPredictions(start_time=2021-04-01 08:00:00, end_time=2021-04-01 09:00:00, calls=390, aht=300, tsl=0.8, tat=30, erlangs=32.5, raw_agents=38, p_wait=0.261203)
         """
-        return str(self.to_pandas())
+        return (
+            f'CallCenterPredictions(start_time={self.start_time}, '
+            f'end_time={self.end_time}, calls={self.calls}, aht={self.aht}, '
+            f'tsl={self.tsl}, tat={self.tat}, erlangs={self.erlangs}, '
+            f'raw_agents={self.raw_agents}, p_wait={self.p_wait:.6f})'
+        )
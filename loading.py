@@ -1,8 +1,25 @@
 import sys
 from functools import wraps
-from io import StringIO
-from threading import Thread
-from time import sleep
+from threading import Event, Thread
+
+
+class _PassthroughStream:
+    """Forward writes to the real stdout, clearing the spinner line first.
+
+    Keeps memory usage O(1) however much the wrapped function prints, instead
+    of buffering everything in a StringIO and replaying it afterwards.
+    """
+
+    def __init__(self, target, clear_width):
+        self._target = target
+        self._clear_width = clear_width
+
+    def write(self, text):
+        self._target.write('\r' + ' ' * self._clear_width + '\r')
+        return self._target.write(text)
+
+    def flush(self):
+        self._target.flush()
 
 
 def loading_animation(message=None):
@@ -10,25 +27,26 @@ def loading_animation(message=None):
         @wraps(func)
         def wrapper(*args, **kwargs):
             _chars = ['-', '\\', '|', '/']
-            _done = False
+            _done = Event()
             _result = None
             _display_text = (
                 message if message is not None else f'Executing {func.__name__}'
             )
 
             loading_stdout = sys.stdout
-            func_stdout = StringIO()
-            sys.stdout = func_stdout
+            sys.stdout = _PassthroughStream(
+                loading_stdout, len(_display_text) + 4
+            )
 
             def animate():
-                nonlocal _done
-                while not _done:
+                while not _done.is_set():
                     for c in _chars:
-                        if _done:
-                            break
                         loading_stdout.write(f'\r{_display_text}...{c}')
                         loading_stdout.flush()
-                        sleep(0.1)
+                        # Waiting on the event instead of sleeping lets the
+                        # thread wake immediately when the function finishes.
+                        if _done.wait(0.1):
+                            break
                 loading_stdout.write(f'\r{_display_text}...done\n')
                 loading_stdout.flush()
 
@@ -38,10 +56,9 @@ def loading_animation(message=None):
             try:
                 _result = func(*args, **kwargs)
             finally:
-                _done = True
+                _done.set()
                 _t.join()
                 sys.stdout = loading_stdout
-                print(func_stdout.getvalue(), end='')
 
             return _result
 
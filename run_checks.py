@@ -1,35 +1,65 @@
 """Module that executes code standardization and functionality tests."""
 
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import run
 from sys import argv, exit
 
 
+def run_command(command: list[str]) -> int:
+    """Execute a single check and report a failure.
+
+    Parameters
+    ----------
+    command : list[str]
+        The command line to execute.
+
+    Returns
+    -------
+    int
+        The exit code of the command.
+    """
+    result = run(command)
+    if result.returncode != 0:
+        print(
+            f'Command {' '.join(command)} failed with exit code {result.returncode}'
+        )
+    return result.returncode
+
+
 def run_checks(target: str) -> None:
-    """Execute all code checks internally in sequence.
+    """Execute all code checks, running the read-only ones concurrently.
 
-    Order: isort → black → pydocstyle → doctest → mypy → pytest
+    Order: isort → black sequentially, since both rewrite files, then
+    pydocstyle, doctest and mypy concurrently, then pytest.
 
     Parameters
     ----------
     target : str
         The target file or directory.
     """
-    commands = [
+    formatters = [
         ['isort', '--only-modified', '--profile', 'black', target],
         ['black', '--skip-string-normalization', target],
+    ]
+    checkers = [
         ['pydocstyle', target],
         ['python', '-m', 'doctest', target],
         ['mypy', '--namespace-packages', '--explicit-package-bases', target],
-        ['pytest', '--verbose'],
     ]
 
-    for command in commands:
-        result = run(command)
-        if result.returncode != 0:
-            print(
-                f'Command {' '.join(command)} failed with exit code {result.returncode}'
-            )
-            exit(result.returncode)
+    for command in formatters:
+        returncode = run_command(command)
+        if returncode != 0:
+            exit(returncode)
+
+    with ThreadPoolExecutor(max_workers=len(checkers)) as executor:
+        for returncode in executor.map(run_command, checkers):
+            if returncode != 0:
+                exit(returncode)
+
+    exit_code = run_command(['pytest', '--verbose'])
+    if exit_code != 0:
+        exit(exit_code)
 
 
 if __name__ == '__main__':